@@ -9,8 +9,8 @@ and shows a crescent moon and a line of text saying "Good night!"
 after the sun dips below the horizon.
 """
 
+import math
 import tkinter
-import time
 from graphics import Canvas
 
 CANVAS_WIDTH = 600  # Width of drawing canvas in pixels
@@ -21,64 +21,201 @@ SUN_SIZE = 70  # Width and height of the sun oval
 ORANGE_Y = CANVAS_HEIGHT * (1 / 3)
 # The sun turns red when the middle of the sun passes this y location
 RED_Y = CANVAS_HEIGHT * (2 / 3)
+# The same transitions expressed in terms of the sun's top y location
+ORANGE_THRESH = ORANGE_Y - SUN_SIZE / 2
+RED_THRESH = RED_Y - SUN_SIZE / 2
+# Top y locations at which the sun moves on to the next color
+COLOR_THRESHOLDS = (ORANGE_THRESH, RED_THRESH)
+# Sun colors, indexed by the color code returned from get_sun_color
+SUN_COLORS = ('yellow', 'orange', 'red')
+
+SUN_DY = 0.8  # Distance the sun moves down each frame
+
+WAVE_WIDTH = 60  # Width of one wave arch along the top of the sea
+WAVE_HEIGHT = 15  # Height of one wave arch
+WAVE_STEP = 5  # Horizontal distance between the points tracing the waves
+
+MOON_STEP = 5  # Angle in degrees between the points tracing the crescent moon
+
+FRAME_MS = 10  # Delay between animation frames in milliseconds
 
 
 def main():
     canvas = Canvas(CANVAS_WIDTH, CANVAS_HEIGHT, 'Sunset')
-    sky = canvas.set_canvas_background_color('deep sky blue')
+    canvas.set_canvas_background_color('deep sky blue')
     sea_y = CANVAS_HEIGHT * (3 / 4)
-    sea = canvas.create_rectangle(0, sea_y, CANVAS_WIDTH, CANVAS_HEIGHT, fill='turquoise4', outline='turquoise4')
-    # Create wavy effect of the sea.
-    for i in range(0, 1000, 60):
-        canvas.create_oval(i, sea_y - 15, i + 60, sea_y + 15, tags='wave', fill='turquoise4', outline='turquoise4')
+    # The sea is a single polygon whose top edge is scalloped to look like waves.  It extends one
+    # wave past the right edge of the canvas, since the waves drift left during the animation.
+    sea = canvas.create_polygon(*get_sea_points(sea_y, CANVAS_WIDTH + WAVE_WIDTH, CANVAS_HEIGHT),
+                                fill='turquoise4', outline='')
     # Create two clouds.
-    canvas.create_oval(90, 40, 140, 80, tags='cloud1', fill='light cyan', outline='light cyan')
-    canvas.create_oval(120, 30, 180, 90, tags='cloud1', fill='light cyan', outline='light cyan')
-    canvas.create_oval(160, 40, 210, 80, tags='cloud1', fill='light cyan', outline='light cyan')
-    canvas.create_oval(490, 30, 545, 65, tags='cloud2', fill='light cyan', outline='light cyan')
-    canvas.create_oval(460, 30, 515, 65, tags='cloud2', fill='light cyan', outline='light cyan')
-    canvas.create_oval(475, 55, 530, 90, tags='cloud2', fill='light cyan', outline='light cyan')
-    canvas.create_oval(445, 55, 500, 90, tags='cloud2', fill='light cyan', outline='light cyan')
+    canvas.create_ovals([(90, 40, 140, 80), (120, 30, 180, 90), (160, 40, 210, 80)],
+                        tags=('cloud1', 'clouds'), fill='light cyan', outline='')
+    canvas.create_ovals([(490, 30, 545, 65), (460, 30, 515, 65), (475, 55, 530, 90), (445, 55, 500, 90)],
+                        tags=('cloud2', 'clouds'), fill='light cyan', outline='')
     # Create the setting sun.
     x0 = (CANVAS_WIDTH - SUN_SIZE) / 2
     y0 = 0
     x1 = (CANVAS_WIDTH + SUN_SIZE) / 2
     y1 = y0 + SUN_SIZE
-    sun = canvas.create_oval(x0, y0, x1, y1, fill='yellow', outline='yellow')
-
-    while not is_off_screen(canvas, sun):
-        canvas.move(sun, 0, 0.8)
-        canvas.move('cloud1', 0.1, 0)
-        canvas.move('cloud2', 0.1, 0)
-        canvas.move('wave', -0.5, 0)
-        canvas.update()
-        time.sleep(1 / 100)
-        y0 = canvas.get_top_y(sun)
-        canvas.set_fill_color(sun, get_sun_color(y0))
-        canvas.set_outline_color(sun, get_sun_color(y0))
-    canvas.set_canvas_background_color('midnight blue')
-    canvas.create_text(200, 130, anchor='w', font=('Garamond', '36'), fill='gold', text='Good Night!')
-    # After the sunset, a crescent moon appears with a text wishing "Good night!"
-    canvas.create_oval(25, 25, 75, 75, fill='goldenrod1', outline='goldenrod1')
-    canvas.create_oval(40, 15, 110, 80, fill='midnight blue', outline='midnight blue')
+    sun = canvas.create_oval(x0, y0, x1, y1, fill='yellow', outline='')
+    # The night sky is created up front but hidden behind everything else, so showing it later
+    # doesn't require reconfiguring (and fully repainting) the canvas background.
+    night = canvas.create_rectangle(0, 0, CANVAS_WIDTH, CANVAS_HEIGHT, fill='midnight blue', outline='',
+                                    state='hidden')
+    canvas.lower_to_back(night)
 
-    print("animation complete")
+    # Track the sun's top y on the Python side instead of querying the canvas every frame
+    sun_y = y0
+    color_state = 0  # index into SUN_COLORS
+    # How far the sea has drifted left of where it started, tracked on the Python side
+    sea_x = 0
+    # Every frame's canvas updates are sent to Tcl as one script; these moves are the same every frame
+    frame_commands = [
+        canvas.move_command(sun, 0, SUN_DY),
+        canvas.move_command('clouds', 0.1, 0),
+        canvas.move_command(sea, -0.5, 0),
+    ]
+
+    def tick():
+        """
+        Advances the animation by one frame, then schedules the next frame with Tk.  Once the sun
+        is off screen, draws the night scene instead.
+        """
+        nonlocal sun_y, color_state, sea_x
+        sun_y, new_color_state, done = step(sun_y, color_state)
+        commands = list(frame_commands)
+        sea_x -= 0.5
+        # The waves repeat every WAVE_WIDTH, so once the sea has drifted a whole wave, jump it
+        # back; this looks the same and keeps the sea covering the canvas indefinitely.
+        if sea_x <= -WAVE_WIDTH:
+            commands.append(canvas.move_command(sea, WAVE_WIDTH, 0))
+            sea_x += WAVE_WIDTH
+        if new_color_state != color_state:
+            color_state = new_color_state
+            commands.append(canvas.itemconfig_command(sun, fill=SUN_COLORS[color_state]))
+        canvas.run_commands(commands)
+        if done:
+            draw_night(canvas, night)
+            print("animation complete")
+        else:
+            canvas.main_window.after(FRAME_MS, tick)
+
+    tick()
     canvas.mainloop()
 
 
-def is_off_screen(canvas, cir):
-    top_y = canvas.get_top_y(cir)
+def draw_night(canvas, night):
+    """
+    After the sunset, shows the night sky, and a crescent moon appears with a text wishing "Good night!"
+    """
+    canvas.set_hidden(night, False)
+    canvas.create_text(200, 130, anchor='w', font=('Garamond', '36'), fill='gold', text='Good Night!')
+    canvas.create_polygon(*get_crescent_points((25, 25, 75, 75), (40, 15, 110, 80)), fill='goldenrod1', outline='')
+
+
+def step(sun_y, color_state):
+    """
+    Given the sun's top y location and its current color code, works out one frame of the sun's
+    movement without touching the canvas.  Returns a tuple of the sun's new top y location, its
+    new color code and whether it is now off screen.
+    >>> step(0, 0)
+    (0.8, 0, False)
+    >>> step(ORANGE_THRESH, 0)[1]
+    1
+    >>> step(CANVAS_HEIGHT, 2)[2]
+    True
+    """
+    sun_y += SUN_DY
+    # The sun only ever moves down, so the color changes exactly twice; only look
+    # up the color when the next threshold is crossed.
+    if color_state < len(COLOR_THRESHOLDS) and sun_y > COLOR_THRESHOLDS[color_state]:
+        color_state = get_sun_color(sun_y)
+    return sun_y, color_state, is_off_screen(sun_y)
+
+
+def is_off_screen(top_y):
     return top_y >= CANVAS_HEIGHT
 
 
 def get_sun_color(top_y):
-    if top_y > RED_Y - SUN_SIZE / 2:
-        clr = 'red'
-    elif top_y > ORANGE_Y - SUN_SIZE / 2:
-        clr = 'orange'
+    """
+    Given the sun's top y location, returns the code of the color the sun should be:
+    0 for yellow, 1 for orange and 2 for red (see SUN_COLORS).
+    >>> get_sun_color(0)
+    0
+    >>> get_sun_color(ORANGE_THRESH + 1)
+    1
+    >>> get_sun_color(RED_THRESH + 1)
+    2
+    """
+    if top_y > RED_THRESH:
+        return 2
+    elif top_y > ORANGE_THRESH:
+        return 1
     else:
-        clr = 'yellow'
-    return clr
+        return 0
+
+
+def get_sea_points(sea_y, width, height):
+    """
+    Returns the flattened x, y points of a sea polygon whose top edge is a row of wave arches
+    (the tops of ovals WAVE_WIDTH wide and 2 * WAVE_HEIGHT tall, centered on sea_y), running from
+    x = 0 to x = width, and whose bottom edge is at the given height.
+    >>> points = get_sea_points(100, 60, 200)
+    >>> points[:2], points[-4:]
+    ([0, 100.0], [60, 200, 0, 200])
+    >>> min(points[1::2])
+    85.0
+    """
+    points = []
+    for x in range(0, width + 1, WAVE_STEP):
+        offset = (x % WAVE_WIDTH - WAVE_WIDTH / 2) / (WAVE_WIDTH / 2)
+        points += [x, sea_y - WAVE_HEIGHT * math.sqrt(1 - offset ** 2)]
+    return points + [width, height, 0, height]
+
+
+def get_crescent_points(moon_box, shadow_box):
+    """
+    Returns the flattened x, y points of the crescent left over when the oval with bounding box
+    shadow_box is cut out of the oval with bounding box moon_box.  The crescent is traced along
+    the moon's edge, then back along the shadow's edge.  Assumes the shadow covers the moon's
+    right-hand side (angle 0) but not its left-hand side.
+    >>> points = get_crescent_points((0, 0, 100, 100), (50, 0, 150, 100))
+    >>> min(points[0::2]), max(points[0::2]) <= 75
+    (0.0, True)
+    """
+    moon_edge = [point for point in get_oval_points(moon_box) if not is_inside_oval(point, shadow_box)]
+    shadow_edge = [point for point in get_oval_points(shadow_box) if is_inside_oval(point, moon_box)]
+    points = []
+    for x, y in moon_edge + shadow_edge[::-1]:
+        points += [x, y]
+    return points
+
+
+def get_oval_points(box):
+    """
+    Returns a list of (x, y) points, MOON_STEP degrees apart, around the edge of the oval with the
+    given bounding box, going counterclockwise from its rightmost point.
+    >>> get_oval_points((0, 0, 2, 2))[0]
+    (2.0, 1.0)
+    """
+    x0, y0, x1, y1 = box
+    cx, cy, rx, ry = (x0 + x1) / 2, (y0 + y1) / 2, (x1 - x0) / 2, (y1 - y0) / 2
+    return [(cx + rx * math.cos(math.radians(angle)), cy - ry * math.sin(math.radians(angle)))
+            for angle in range(0, 360, MOON_STEP)]
+
+
+def is_inside_oval(point, box):
+    """
+    Returns True if the given (x, y) point is strictly inside the oval with the given bounding box.
+    >>> is_inside_oval((1, 1), (0, 0, 2, 2)), is_inside_oval((0, 0), (0, 0, 2, 2))
+    (True, False)
+    """
+    x, y = point
+    x0, y0, x1, y1 = box
+    cx, cy, rx, ry = (x0 + x1) / 2, (y0 + y1) / 2, (x1 - x0) / 2, (y1 - y0) / 2
+    return ((x - cx) / rx) ** 2 + ((y - cy) / ry) ** 2 < 1
 
 
 if __name__ == '__main__':
@@ -74,15 +74,28 @@ class Canvas(tkinter.Canvas):
         self.wait_for_click_click_happened = False
         self.currently_waiting_for_click = False
 
-        # bind events
+        # Maps each bound event sequence to the funcid tkinter returned for its handler, so it can be unbound
+        self._bound_events = {}
+
+        # bind events.  Clicks and key presses are always recorded, so get_new_mouse_clicks and
+        # get_new_key_presses see everything since the canvas was created; mouse releases and
+        # entering/leaving the canvas are only bound once something needs them (see __ensure_bound)
         self.focus_set()
-        self.bind("<Button-1>", lambda event: self.__mouse_pressed(event))
-        self.bind("<ButtonRelease-1>", lambda event: self.__mouse_released(event))
-        self.bind("<Key>", lambda event: self.__key_pressed(event))
-        self.bind("<Enter>", lambda event: self.__mouse_entered())
-        self.bind("<Leave>", lambda event: self.__mouse_exited())
+        self.__ensure_bound("<Button-1>", self.__mouse_pressed)
+        self.__ensure_bound("<Key>", self.__key_pressed)
 
+        # Maps each image object to the _image_cache key of the image it displays
         self._image_gb_protection = {}
+
+        # Images already loaded, keyed by (file_path, width, height), so loading the same image again is free,
+        # along with how many image objects on the canvas use each one.  An image is dropped from the cache
+        # once the last object using it is deleted.
+        self._image_cache = {}
+        self._image_uses = {}
+
+        # Maps each graphical object created through this canvas to its type (e.g. 'oval', 'text'),
+        # so we don't have to ask Tcl for it every time we need it
+        self._kind = {}
         self.pack()
         self.update()
 
@@ -159,6 +172,7 @@ class Canvas(tkinter.Canvas):
                 If this parameter is None, no function will be called when the mouse is released.
         """
         self.on_mouse_released = callback
+        self.__ensure_bound("<ButtonRelease-1>", self.__mouse_released)
 
     def set_on_key_pressed(self, callback):
         """
@@ -200,6 +214,32 @@ class Canvas(tkinter.Canvas):
         self.key_presses = []
         return presses
 
+    def __ensure_bound(self, sequence, handler):
+        """
+        Binds the specified handler to the specified event sequence, unless that sequence has already been bound.
+
+        Args:
+            sequence: the event sequence to bind, e.g. "<Button-1>"
+            handler: the function to call for each event.  Must take in one parameter, the event that occurred.
+
+        Returns:
+            True if the sequence was bound by this call, or False if it had already been bound.
+        """
+        if sequence in self._bound_events:
+            return False
+        self._bound_events[sequence] = self.bind(sequence, handler)
+        return True
+
+    def __unbind(self, sequence):
+        """
+        Unbinds the handler bound to the specified event sequence by `Canvas.__ensure_bound`, and frees the Tcl
+        command tkinter created for it.
+
+        Args:
+            sequence: the event sequence to unbind, e.g. "<Button-1>"
+        """
+        self.unbind(sequence, self._bound_events.pop(sequence))
+
     def __mouse_pressed(self, event):
         """
         Called every time the mouse is pressed.  If we are currently waiting for a mouse click via
@@ -271,18 +311,28 @@ class Canvas(tkinter.Canvas):
         Returns:
             True if the mouse is currently on the canvas, or False otherwise.
         """
+        # Start tracking the mouse the first time we're asked, so find out where it is right now
+        if self.__ensure_bound("<Enter>", lambda event: self.__mouse_entered()):
+            self.__ensure_bound("<Leave>", lambda event: self.__mouse_exited())
+            self.mouse_on_canvas = self.winfo_containing(self.winfo_pointerx(), self.winfo_pointery()) == self
         return self.mouse_on_canvas
 
     def wait_for_click(self):
         """
         Waits until a mouse click occurs, and then returns.
         """
+        # Listen for the click ourselves if nothing else is listening for mouse releases
+        bound_here = self.__ensure_bound("<ButtonRelease-1>", self.__mouse_released)
         self.currently_waiting_for_click = True
         self.wait_for_click_click_happened = False
-        while not self.wait_for_click_click_happened:
-            self.update()
-        self.currently_waiting_for_click = False
-        self.wait_for_click_click_happened = False
+        try:
+            while not self.wait_for_click_click_happened:
+                self.update()
+        finally:
+            self.currently_waiting_for_click = False
+            self.wait_for_click_click_happened = False
+            if bound_here:
+                self.__unbind("<ButtonRelease-1>")
 
     def get_mouse_x(self):
         """
@@ -316,6 +366,22 @@ class Canvas(tkinter.Canvas):
 
     """ GRAPHICAL OBJECT MANIPULATION """
 
+    def __get_kind(self, obj):
+        """
+        Returns the type of the specified graphical object, e.g. 'oval' or 'text'.  Uses the type recorded when the
+        object was created if there is one, and otherwise asks tkinter.
+
+        Args:
+            obj: the object for which to get the type
+
+        Returns:
+            the type of the specified graphical object, as a string.
+        """
+        kind = self._kind.get(obj)
+        if kind is None:
+            kind = self.type(obj)
+        return kind
+
     def get_left_x(self, obj):
         """
         Returns the leftmost x coordinate of the specified graphical object.
@@ -326,7 +392,7 @@ class Canvas(tkinter.Canvas):
         Returns:
             the leftmost x coordinate of the specified graphical object.
         """
-        if self.type(obj) != "text":
+        if self.__get_kind(obj) != "text":
             return self.coords(obj)[0]
         else:
             return self.coords(obj)[0] - self.get_width(obj) / 2
@@ -341,18 +407,52 @@ class Canvas(tkinter.Canvas):
         Returns:
             the topmost y coordinate of the specified graphical object.
         """
-        if self.type(obj) != "text":
+        if self.__get_kind(obj) != "text":
             return self.coords(obj)[1]
         else:
             return self.coords(obj)[1] - self.get_height(obj) / 2
 
+    def get_width(self, obj):
+        """
+        Returns the width of the specified graphical object.
+
+        Args:
+            obj: the object for which to calculate the width
+
+        Returns:
+            the width of the specified graphical object.
+        """
+        x0, y0, x1, y1 = self.bbox(obj)
+        return x1 - x0
+
+    def get_height(self, obj):
+        """
+        Returns the height of the specified graphical object.
+
+        Args:
+            obj: the object for which to calculate the height
+
+        Returns:
+            the height of the specified graphical object.
+        """
+        x0, y0, x1, y1 = self.bbox(obj)
+        return y1 - y0
+
     def move_to(self, obj, new_x, new_y):
         """
         Same as `Canvas.moveto`.
         """
         # Note: Implements manually due to inconsistencies on some machines of bbox vs. coord.
-        old_x = self.get_left_x(obj)
-        old_y = self.get_top_y(obj)
+        # Same as get_left_x and get_top_y, but looks up the object's coordinates only once.
+        coords = self.coords(obj)
+        old_x = coords[0]
+        old_y = coords[1]
+        if self.__get_kind(obj) == "text":
+            x0, y0, x1, y1 = self.bbox(obj)
+            old_x -= (x1 - x0) / 2
+            old_y -= (y1 - y0) / 2
+        new_x = self.__get_new_coordinate(new_x, old_x)
+        new_y = self.__get_new_coordinate(new_y, old_y)
         self.move(obj, new_x - old_x, new_y - old_y)
 
     def moveto(self, obj, x='', y=''):
@@ -362,10 +462,29 @@ class Canvas(tkinter.Canvas):
 
         Args:
             obj: the object to move
-            x: the new x coordinate of the upper-left corner for the object
-            y: the new y coordinate of the upper-left corner for the object
+            x: the new x coordinate of the upper-left corner for the object, or '' to keep its current x coordinate
+            y: the new y coordinate of the upper-left corner for the object, or '' to keep its current y coordinate
+        """
+        self.move_to(obj, x, y)
+
+    def __get_new_coordinate(self, value, old_value):
+        """
+        Returns the coordinate to move to for a value passed to `Canvas.moveto`.  Like tkinter's moveto, an empty
+        string means to keep the current coordinate.  Numbers are used as-is, and anything else is converted with
+        float().
+
+        Args:
+            value: the coordinate passed to moveto
+            old_value: the object's current coordinate
+
+        Returns:
+            the coordinate to move the object to, as a number.
         """
-        self.move_to(obj, float(x), float(y))
+        if value == '':
+            return old_value
+        if isinstance(value, (int, float)):
+            return value
+        return float(value)
 
     def set_hidden(self, obj, hidden):
         """
@@ -494,6 +613,150 @@ class Canvas(tkinter.Canvas):
         """
         self.tag_lower(obj, behind)
 
+    """ BATCHED COMMANDS """
+
+    def __tcl_command(self, *words, **kwargs):
+        """
+        Returns a Tcl command for this canvas made of the specified words followed by the specified options, with
+        every word quoted so that e.g. tags containing spaces or braces are passed through unchanged.
+
+        Args:
+            words: the words of the command after the canvas itself, e.g. 'move', obj, dx, dy
+            kwargs: tkinter keyword args to append to the command as Tcl options (e.g. fill, tags)
+
+        Returns:
+            the Tcl command, as a string.
+        """
+        # Note: tkinter has no public way to build a Tcl command string, so this is the one place that relies on
+        # tkinter internals: _options turns keyword args into Tcl option/value words the same way all tkinter
+        # methods do, and _stringify quotes a single word for Tcl.
+        words = (self._w,) + words + self._options(kwargs)
+        return " ".join(tkinter._stringify(word) for word in words)
+
+    def move_command(self, obj, dx, dy):
+        """
+        Returns the Tcl command that moves the specified graphical object, without running it.
+        Pass a list of these commands to `Canvas.run_commands` to apply them all at once.
+
+        Args:
+            obj: the object the command should move
+            dx: the distance to move the object in the x direction
+            dy: the distance to move the object in the y direction
+
+        Returns:
+            the Tcl command, as a string.
+        """
+        return self.__tcl_command('move', obj, dx, dy)
+
+    def itemconfig_command(self, obj, **kwargs):
+        """
+        Returns the Tcl command that configures the specified graphical object, without running it.
+        Pass a list of these commands to `Canvas.run_commands` to apply them all at once.
+
+        Args:
+            obj: the object the command should configure
+            kwargs: the tkinter keyword args to set on the object (e.g. fill, outline)
+
+        Returns:
+            the Tcl command, as a string.
+        """
+        return self.__tcl_command('itemconfigure', obj, **kwargs)
+
+    def run_commands(self, commands):
+        """
+        Runs the specified Tcl commands in a single call into the Tcl interpreter.  This is much faster than
+        making one tkinter call per command when many objects need updating each frame.
+
+        Args:
+            commands: a list of Tcl command strings, such as those returned by `Canvas.move_command` and
+                `Canvas.itemconfig_command`
+        """
+        if commands:
+            self.tk.eval("\n".join(commands))
+
+    """ GRAPHICAL OBJECT CREATION """
+
+    def create_oval(self, *args, **kwargs):
+        """
+        Same as `tkinter.Canvas.create_oval`.
+        """
+        obj = super().create_oval(*args, **kwargs)
+        self._kind[obj] = 'oval'
+        return obj
+
+    def create_ovals(self, coords_list, **kwargs):
+        """
+        Creates one oval for each set of coordinates in the specified list, all with the same options, using a
+        single call into the Tcl interpreter.
+
+        Args:
+            coords_list: a list of (x0, y0, x1, y1) bounding boxes, one for each oval to create
+            kwargs: other tkinter keyword args, applied to every oval (e.g. fill, outline, tags)
+
+        Returns:
+            a list of the graphical oval objects created, in the same order as coords_list.
+        """
+        commands = ["[" + self.__tcl_command('create', 'oval', *coords, **kwargs) + "]" for coords in coords_list]
+        if not commands:
+            return []
+        objs = [int(obj) for obj in self.tk.splitlist(self.tk.eval("list " + " ".join(commands)))]
+        for obj in objs:
+            self._kind[obj] = 'oval'
+        return objs
+
+    def create_rectangle(self, *args, **kwargs):
+        """
+        Same as `tkinter.Canvas.create_rectangle`.
+        """
+        obj = super().create_rectangle(*args, **kwargs)
+        self._kind[obj] = 'rectangle'
+        return obj
+
+    def create_text(self, *args, **kwargs):
+        """
+        Same as `tkinter.Canvas.create_text`.
+        """
+        obj = super().create_text(*args, **kwargs)
+        self._kind[obj] = 'text'
+        return obj
+
+    def delete(self, *args):
+        """
+        Same as `tkinter.Canvas.delete`.
+        """
+        # Tk never reuses object ids, so leftover _kind entries are harmless; only ask Tcl which objects a
+        # tag refers to when that's needed to release image references.
+        objs = set()
+        for obj in args:
+            if obj == 'all':
+                self._kind.clear()
+                self._image_gb_protection.clear()
+                self._image_cache.clear()
+                self._image_uses.clear()
+            elif isinstance(obj, int):
+                objs.add(obj)
+            elif self._image_gb_protection:
+                objs.update(self.find_withtag(obj))
+        super().delete(*args)
+        for obj in objs:
+            self._kind.pop(obj, None)
+            self.__release_image(obj)
+
+    def __release_image(self, obj):
+        """
+        Forgets the image displayed by the specified deleted image object, dropping it from the image cache if no
+        other object on the canvas displays it.  Does nothing if the object is not an image object.
+
+        Args:
+            obj: the deleted object
+        """
+        key = self._image_gb_protection.pop(obj, None)
+        if key is None:
+            return
+        self._image_uses[key] -= 1
+        if self._image_uses[key] == 0:
+            del self._image_uses[key]
+            del self._image_cache[key]
 
     def create_image_with_size(self, x, y, width, height, file_path, **kwargs):
         """
@@ -530,17 +793,24 @@ class Canvas(tkinter.Canvas):
         Returns:
             the graphical image object that is displaying the specified image at the specified location.
         """
-        from PIL import ImageTk
-        from PIL import Image
-        image = Image.open(file_path)
+        # Reuse the image if this file has already been loaded at this size
+        key = (file_path, width, height)
+        image = self._image_cache.get(key)
+        if image is None:
+            from PIL import ImageTk
+            from PIL import Image
+            image = Image.open(file_path)
 
-        # Resize the image if another width and height is specified
-        if width is not None and height is not None:
-            image = image.resize((width, height))
+            # Resize the image if another width and height is specified
+            if width is not None and height is not None:
+                image = image.resize((width, height))
 
-        image = ImageTk.PhotoImage(image)
+            image = ImageTk.PhotoImage(image)
+            self._image_cache[key] = image
         img_obj = super().create_image(x, y, anchor="nw", image=image, **kwargs)
-        # note: if you don't do this, the image gets garbage collected!!!
-        # this introduces a memory leak which can be fixed by overloading delete
-        self._image_gb_protection[img_obj] = image
+        self._kind[img_obj] = 'image'
+        # note: if you don't keep a reference to the image, it gets garbage collected!!!
+        # The cache holds it for as long as some image object uses it; delete releases it again.
+        self._image_gb_protection[img_obj] = key
+        self._image_uses[key] = self._image_uses.get(key, 0) + 1
         return img_obj
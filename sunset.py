@@ -19,6 +19,8 @@ ORANGE_Y = CANVAS_HEIGHT * (1 / 3)
 # The sun turns red when the middle of the sun passes this y location
 RED_Y = CANVAS_HEIGHT * (2 / 3)
 
+EVENT_FRAMES = 10  # Number of animation frames between processing window events
+
 
 def main():
     canvas = Canvas(CANVAS_WIDTH, CANVAS_HEIGHT, 'Sunset')
@@ -28,18 +30,31 @@ def main():
     x1 = (CANVAS_WIDTH + SUN_SIZE) / 2
     y1 = y0 + SUN_SIZE
     cir = canvas.create_oval(x0, y0, x1, y1, fill='yellow')
-    while not is_off_screen(canvas, cir):
+    # Track the sun's top y on the Python side instead of querying the canvas every frame
+    sun_y = y0
+    frame = 0
+    last_color = 'yellow'
+    while not is_off_screen(sun_y):
         canvas.move(cir, 0, 1)
-        canvas.update()
+        sun_y += 1
+        # Only redraw each frame; handle other window events (e.g. the window being closed)
+        # every EVENT_FRAMES frames, since the animation doesn't take any input.
+        frame += 1
+        if frame % EVENT_FRAMES == 0:
+            canvas.update()
+        else:
+            canvas.update_idletasks()
         time.sleep(1 / 40)
-        y0 = canvas.get_top_y(cir)
-        canvas.set_fill_color(cir, get_sun_color(y0))
+        # Only recolor the sun when its color actually changes
+        color = get_sun_color(sun_y)
+        if color != last_color:
+            canvas.set_fill_color(cir, color)
+            last_color = color
     print("animation complete")
     canvas.mainloop()
 
 
-def is_off_screen(canvas, cir):
-    top_y = canvas.get_top_y(cir)
+def is_off_screen(top_y):
     return top_y >= CANVAS_HEIGHT
 
 